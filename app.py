@@ -1,16 +1,82 @@
 # app.py
 import streamlit as st
-import google.generativeai as genai
 import requests
+import base64
+import concurrent.futures
+import hashlib
 import os
 import json
+import pathlib
 import re
-from dotenv import load_dotenv
+import string
+import time
+from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Shared HTTP session: keep-alive + pooled connections avoid a fresh
+# TCP/TLS handshake on every FactCheck/NewsAPI call.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    ),
+)
+SESSION.headers["Accept-Encoding"] = "gzip"
+
+# Bound the tail: fail fast on connect, and never read more than the cap —
+# the callers only use the first few results of each payload.
+REQUEST_TIMEOUT = (2, 4)  # (connect, read) seconds
+MAX_RESPONSE_BYTES = 262144  # 256 KB
+
+def _get_json_capped(url, params):
+    """GET url and decode JSON, reading at most MAX_RESPONSE_BYTES.
+
+    Returns the decoded payload, or None on a non-200 status. Oversized
+    responses are truncated and will fail decoding (treated as a miss).
+    """
+    r = SESSION.get(url, params=params, timeout=REQUEST_TIMEOUT, stream=True)
+    try:
+        if r.status_code != 200:
+            return None
+        buf = bytearray()
+        for chunk in r.iter_content(chunk_size=65536):
+            buf.extend(chunk)
+            if len(buf) > MAX_RESPONSE_BYTES:
+                break
+        return _loads(bytes(buf))
+    finally:
+        r.close()
+
+# Faster Rust JSON decoder when available; stdlib otherwise (same loads() API)
+try:
+    import orjson
+    _loads = orjson.loads
+except Exception:
+    _loads = json.loads
+
+# Optional on-disk cache (falls back to in-process dict if diskcache missing)
+try:
+    import diskcache
+    _CACHE = diskcache.Cache("./.gemcache")
+except Exception:
+    _CACHE = None
+_MEM_CACHE = {}
 
 # ----------------------
 # 🔑 API Key Setup
 # ----------------------
-load_dotenv()
+@st.cache_resource
+def _load_env():
+    """Read .env once per process instead of on every script rerun."""
+    from dotenv import load_dotenv
+    load_dotenv()
+    return True
+
+_load_env()
 
 # Primary env names supported (backwards-friendly)
 gemini_key = (
@@ -29,12 +95,15 @@ newsapi_key = (
     or os.getenv("NEWSAPI")
 )
 
-# Configure Gemini client if key present
-if gemini_key:
+# Gemini client, created lazily: the genai import drags in gRPC/protobuf,
+# so reruns that never reach the model pay nothing for it.
+@st.cache_resource
+def _get_model():
+    if not gemini_key:
+        return None  # handle gracefully later
+    import google.generativeai as genai
     genai.configure(api_key=gemini_key)
-    model = genai.GenerativeModel("gemini-1.5-flash")
-else:
-    model = None  # handle gracefully later
+    return genai.GenerativeModel("gemini-1.5-flash")
 
 # ----------------------
 # 🔗 Trusted Sources (kept comprehensive; UI remains unchanged)
@@ -49,6 +118,77 @@ DOMAIN_SOURCES = {
     "General": ["Reuters", "BBC", "AP News", "The Hindu"]
 }
 
+# Hoisted out of verify_claim: immutable source tuples and their joined form,
+# computed once at import instead of per request.
+DOMAIN_SOURCES_TUPLE = {k: tuple(v) for k, v in DOMAIN_SOURCES.items()}
+DOMAIN_SOURCES_JOINED = {k: ", ".join(v) for k, v in DOMAIN_SOURCES.items()}
+
+# Lowercased lookup table: one dict get per call instead of .title() + membership test.
+_DOMAIN_NORMALIZE = {k.lower(): k for k in DOMAIN_SOURCES}
+# The UI offers "Environment" but the curated sources live under "Climate";
+# without this alias those queries silently fell back to "General".
+_DOMAIN_NORMALIZE["environment"] = "Climate"
+
+# One template serves both the news path and the trusted-sources fallback.
+PROMPT_TMPL = string.Template("""
+You are an AI misinformation checker.
+Claim: "$claim"
+Domain: $domain
+Use these sources: $sources.
+Set status to True/False/Misleading/Unverified ("Unverified" if unsure),
+confidence between 0 and 1, and sources to those supporting your verdict.
+""")
+
+# ----------------------
+# 📐 Structured output (server-side JSON; avoids prose responses and regex fallbacks)
+# ----------------------
+RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "claim": {"type": "string"},
+        "domain": {"type": "string"},
+        "status": {"type": "string"},
+        "confidence": {"type": "number"},
+        "explanation": {"type": "string"},
+        "sources": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["claim", "domain", "status", "confidence", "explanation", "sources"],
+}
+GENERATION_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": RESPONSE_SCHEMA,
+}
+
+# ----------------------
+# 💾 Response cache helpers
+# ----------------------
+# Bump whenever a prompt template changes so stale cached answers are not reused.
+PROMPT_VERSION = "3"
+CACHE_TTL = 86400  # seconds
+
+def _cache_key(*parts):
+    """Build a stable SHA-256 key from normalized string parts."""
+    raw = "\x1f".join(str(p) for p in parts)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+def _cache_get(key):
+    if _CACHE is not None:
+        return _CACHE.get(key)
+    entry = _MEM_CACHE.get(key)
+    if entry and entry[0] > time.time():
+        return entry[1]
+    return None
+
+def _cache_set(key, value, expire=CACHE_TTL):
+    if _CACHE is not None:
+        _CACHE.set(key, value, expire=expire)
+    else:
+        _MEM_CACHE[key] = (time.time() + expire, value)
+
+def _date_bucket():
+    """Coarse time bucket so search results refresh daily without manual invalidation."""
+    return time.strftime("%Y-%m-%d")
+
 # ----------------------
 # 🔍 Fact Check API (Google Fact Check Tools)
 # ----------------------
@@ -56,14 +196,18 @@ def fact_check_search(query: str):
     """Query Google Fact Check Tools. Returns parsed JSON or {} on failure."""
     if not fact_check_key:
         return {}
+    key = _cache_key("factcheck", query.strip().lower(), _date_bucket())
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
     url = "https://factchecktools.googleapis.com/v1alpha1/claims:search"
     params = {"query": query, "key": fact_check_key}
     try:
-        r = requests.get(url, params=params, timeout=10)
-        if r.status_code == 200:
-            return r.json()
-        else:
+        data = _get_json_capped(url, params)
+        if data is None:
             return {}
+        _cache_set(key, data)
+        return data
     except Exception:
         return {}
 
@@ -74,70 +218,156 @@ def web_verify(claim: str):
     """Search news (NewsAPI). Returns list of top URLs or [] if unavailable."""
     if not newsapi_key:
         return []
+    key = _cache_key("news", claim.strip().lower(), _date_bucket())
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
     url = "https://newsapi.org/v2/everything"
     params = {"q": claim, "apiKey": newsapi_key, "pageSize": 5, "sortBy": "relevancy"}
     try:
-        r = requests.get(url, params=params, timeout=10)
-        j = r.json()
+        j = _get_json_capped(url, params)
+        if j is None:
+            return []
         articles = j.get("articles", [])
-        return [a.get("url") for a in articles[:3] if a.get("url")]
+        urls = [a.get("url") for a in articles[:3] if a.get("url")]
+        _cache_set(key, urls)
+        return urls
     except Exception:
         return []
 
+# ----------------------
+# ⚡ Concurrent search (FactCheck + NewsAPI overlap instead of running back-to-back)
+# ----------------------
+# Persistent worker pool: threads are created once per process, not per call.
+_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+
+def gather_searches(claim: str):
+    """Kick off both blocking search helpers concurrently.
+
+    Returns (factcheck_json, news_future). Only FactCheck is resolved here —
+    it gates the short-circuit — and the caller waits on the news future
+    strictly after FactCheck misses, so a hit never blocks on NewsAPI.
+    Returns a None future if the pool is unavailable.
+    """
+    try:
+        fc_fut = _POOL.submit(fact_check_search, claim)
+        news_fut = _POOL.submit(web_verify, claim)
+        return fc_fut.result(), news_fut
+    except Exception:
+        return fact_check_search(claim), None
+
 # ----------------------
 # Helper: robust model generation + text extraction
 # ----------------------
-def _generate_with_model(prompt: str):
-    """Call the Gemini model if configured. Return (text, error_message)"""
+def _generate_with_model(prompt: str, stream: bool = True):
+    """Call the Gemini model if configured. Return (text, error_message).
+
+    With stream=True (default) the response is consumed chunk by chunk and
+    reading stops as soon as a complete JSON object has arrived, so trailing
+    tokens never add to the wait.
+    """
+    model = _get_model()
     if model is None:
         return None, "Model not configured (missing GEMINI_API_KEY)."
+    # Identical prompts (modulo whitespace/case) reuse the cached response.
+    key = _cache_key("gemini", PROMPT_VERSION, " ".join(prompt.split()).lower())
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached, None
+
+    if stream:
+        try:
+            resp = model.generate_content(
+                prompt, generation_config=GENERATION_CONFIG, stream=True
+            )
+        except TypeError:
+            stream = False  # older SDK; use the blocking path below
+        except Exception as e:
+            return None, f"Model request failed: {e}"
+    if stream:
+        buf = ""
+        try:
+            for chunk in resp:
+                buf += getattr(chunk, "text", "") or ""
+                idx = buf.find("{")
+                if idx == -1:
+                    continue
+                try:
+                    _JSON_DECODER.raw_decode(buf, idx)
+                except json.JSONDecodeError:
+                    continue
+                break  # complete JSON object received; skip remaining chunks
+        except Exception as e:
+            # Mid-stream failure leaves buf truncated: never return or cache it,
+            # or the poisoned fragment would be served for the full cache TTL.
+            return None, f"Model request failed: {e}"
+        if buf:
+            _cache_set(key, buf)
+            return buf, None
+        return None, "Model returned empty response."
+
     try:
-        resp = model.generate_content(prompt)
+        resp = model.generate_content(prompt, generation_config=GENERATION_CONFIG)
+    except TypeError:
+        # Older SDK without structured-output support: plain call, parsing fallback applies
+        try:
+            resp = model.generate_content(prompt)
+        except Exception as e:
+            return None, f"Model request failed: {e}"
     except Exception as e:
         return None, f"Model request failed: {e}"
 
-    # Extract textual content robustly
-    text = None
-    if hasattr(resp, "text"):
+    # Extract textual content robustly (EAFP: .text is the overwhelmingly common case)
+    try:
         text = resp.text
-    elif hasattr(resp, "content"):
+    except AttributeError:
+        text = None
+    if text is None:
         try:
-            if isinstance(resp.content, list):
-                pieces = []
-                for it in resp.content:
-                    if isinstance(it, dict):
-                        pieces.append(it.get("text", str(it)))
-                    else:
-                        pieces.append(str(it))
-                text = "\n".join(pieces)
-            elif isinstance(resp.content, dict):
-                text = resp.content.get("text", str(resp.content))
-            else:
-                text = str(resp.content)
-        except Exception:
-            text = str(resp.content)
-    else:
-        text = str(resp)
+            content = resp.content
+        except AttributeError:
+            text = str(resp)
+        else:
+            try:
+                if isinstance(content, list):
+                    text = "\n".join(
+                        it.get("text", str(it)) if hasattr(it, "get") else str(it)
+                        for it in content
+                    )
+                elif hasattr(content, "get"):
+                    text = content.get("text", str(content))
+                else:
+                    text = str(content)
+            except Exception:
+                text = str(content)
 
+    if text:
+        _cache_set(key, text)
     return text, None
 
+# Compiled once; only used as a last-resort fallback below.
+_JSON_BLOCK_RE = re.compile(r"\{.*\}", re.DOTALL)
+_JSON_DECODER = json.JSONDecoder()
+
 def _extract_json_from_text(text: str):
     """Try to locate a JSON object inside text and parse it. Returns dict or None."""
     if not text:
         return None
-    # Try direct JSON
-    try:
-        parsed = json.loads(text)
-        if isinstance(parsed, dict):
-            return parsed
-    except Exception:
-        pass
-    # Try finding first {...} block
-    m = re.search(r"\{.*\}", text, flags=re.DOTALL)
+    # Single pass: decode the first complete object starting at the first "{".
+    # raw_decode stops at the object's closing brace, so trailing prose is fine.
+    idx = text.find("{")
+    if idx != -1:
+        try:
+            parsed, _ = _JSON_DECODER.raw_decode(text, idx)
+            if isinstance(parsed, dict):
+                return parsed
+        except json.JSONDecodeError:
+            pass
+    # Fallback: greedy {...} block (catches objects preceded by a stray "{")
+    m = _JSON_BLOCK_RE.search(text)
     if m:
-        snippet = m.group(0)
         try:
-            parsed = json.loads(snippet)
+            parsed = _loads(m.group(0))
             if isinstance(parsed, dict):
                 return parsed
         except Exception:
@@ -145,6 +375,48 @@ def _extract_json_from_text(text: str):
     # No parseable JSON found
     return None
 
+def _parse_model_json(text: str):
+    """Parse a structured-output response in one pass.
+
+    With response_mime_type=application/json the body is a bare object, so a
+    single _loads suffices; the scan/regex recovery only runs if that fails.
+    """
+    if not text:
+        return None
+    try:
+        parsed = _loads(text)
+    except Exception:
+        parsed = None
+    if isinstance(parsed, dict):
+        return parsed
+    return _extract_json_from_text(text)
+
+@dataclass(slots=True, frozen=True)
+class VerifyResult:
+    """Verification outcome. Slotted and frozen: fixed-size layout instead of a
+    per-result dict, and plain attribute access in the renderer."""
+    claim: str
+    domain: str
+    status: str
+    confidence: float
+    explanation: str
+    sources: tuple
+
+def _finalize(parsed: dict, claim: str, domain_key: str, default_sources):
+    """Normalize a model-produced dict into a VerifyResult."""
+    try:
+        confidence = float(parsed.get("confidence", 0) or 0)
+    except Exception:
+        confidence = 0.0
+    return VerifyResult(
+        claim=parsed.get("claim") or claim,
+        domain=parsed.get("domain") or domain_key,
+        status=parsed.get("status") or "Unverified",
+        confidence=confidence,
+        explanation=parsed.get("explanation") or "No explanation provided",
+        sources=tuple(parsed.get("sources") or default_sources),
+    )
+
 # ----------------------
 # ✅ Unified Claim Verification (robust)
 # ----------------------
@@ -154,114 +426,96 @@ def verify_claim(claim: str, domain: str = "Health"):
     1) Google Fact Check Tools
     2) News search + Gemini model
     3) Fallback to trusted domain-specific sources + Gemini
-    Returns a dict with keys: claim, domain, status, confidence (0-1), explanation, sources (list)
+    Returns a VerifyResult: claim, domain, status, confidence (0-1), explanation, sources (tuple)
     """
     # normalize domain key (preserve capitalized keys used by UI)
-    domain_key = domain.title() if isinstance(domain, str) else "General"
-    if domain_key not in DOMAIN_SOURCES:
-        domain_key = "General"
+    domain_key = _DOMAIN_NORMALIZE.get(str(domain or "").lower(), "General")
+
+    claim = (claim or "").strip()
+    # FactCheck's index only matches sentence-like claims; a word or two can
+    # never hit it, so skip that round-trip entirely for fragments.
+    skip_factcheck = len(claim) < 8 or claim.count(" ") < 2
+
+    # Fire both independent searches concurrently; FactCheck gates the short-circuit,
+    # and the news future is only awaited if it misses.
+    if skip_factcheck:
+        fc, news_fut = {}, None
+    else:
+        fc, news_fut = gather_searches(claim)
 
     # 1) FactCheck tools
     try:
-        fc = fact_check_search(claim)
         if fc and isinstance(fc, dict) and "claims" in fc and len(fc["claims"]) > 0:
             claim_data = fc["claims"][0]
             review = claim_data.get("claimReview", [{}])[0]
             status = review.get("textualRating") or review.get("title") or "Unverified"
             explanation = review.get("title") or review.get("textualRating") or review.get("explanation") or ""
             url = review.get("url") or ""
-            result = {
-                "claim": claim,
-                "domain": domain_key,
-                "status": status,
-                "confidence": 0.95,
-                "explanation": explanation,
-                "sources": [url] if url else []
-            }
-            return result
+            return VerifyResult(
+                claim=claim,
+                domain=domain_key,
+                status=status,
+                confidence=0.95,
+                explanation=explanation,
+                sources=(url,) if url else (),
+            )
     except Exception:
         # proceed to next step
         pass
 
-    # 2) News/Web search + Gemini
-    sources = web_verify(claim)
+    # 2) News/Web search + Gemini — only now pay for the news result
+    if news_fut is not None:
+        try:
+            sources = news_fut.result()
+        except Exception:
+            sources = []
+    else:
+        sources = web_verify(claim)
     if sources:
-        prompt = f"""
-You are an AI misinformation checker.
-Claim: "{claim}"
-Domain: {domain_key}
-Use these sources: {sources}.
-Verify if the claim is True/False/Misleading/Unverified.
-Respond ONLY in JSON with the following keys:
-- claim (string)
-- domain (string)
-- status (True/False/Misleading/Unverified)
-- confidence (float between 0 and 1)
-- explanation (string)
-- sources (list of URLs)
-Return strictly valid JSON only.
-"""
+        prompt = PROMPT_TMPL.substitute(
+            claim=claim, domain=domain_key, sources=", ".join(sources)
+        )
         text, err = _generate_with_model(prompt)
         if text:
-            parsed = _extract_json_from_text(text)
+            parsed = _parse_model_json(text)
             if isinstance(parsed, dict):
-                # sanitize and normalize
-                try:
-                    parsed["confidence"] = float(parsed.get("confidence", 0) or 0)
-                except Exception:
-                    parsed["confidence"] = 0.0
-                if "sources" not in parsed or not parsed.get("sources"):
-                    parsed["sources"] = sources
-                parsed.setdefault("claim", claim)
-                parsed.setdefault("domain", domain_key)
-                parsed.setdefault("status", "Unverified")
-                parsed.setdefault("explanation", parsed.get("explanation", "No explanation provided"))
-                return parsed
+                return _finalize(parsed, claim, domain_key, sources)
         # If model failed or returned unparsable text, return measured fallback
-        return {
-            "claim": claim,
-            "domain": domain_key,
-            "status": "Unverified",
-            "confidence": 0.40,
-            "explanation": "Insufficient verifiable evidence from news + model response unparsable.",
-            "sources": sources
-        }
+        return VerifyResult(
+            claim=claim,
+            domain=domain_key,
+            status="Unverified",
+            confidence=0.40,
+            explanation="Insufficient verifiable evidence from news + model response unparsable.",
+            sources=tuple(sources),
+        )
 
     # 3) Fallback to trusted static sources + Gemini
-    fallback_sources = DOMAIN_SOURCES.get(domain_key, [])
-    prompt = f"""
-You are an AI misinformation checker.
-Domain: {domain_key}
-Trusted sources: {', '.join(fallback_sources)}.
-Claim: "{claim}"
-Return JSON with the keys: claim, domain, status, confidence, explanation, sources (list).
-If unsure, set status to "Unverified" and confidence between 0 and 1.
-"""
+    fallback_sources = DOMAIN_SOURCES_TUPLE.get(domain_key, ())
+    prompt = PROMPT_TMPL.substitute(
+        claim=claim, domain=domain_key, sources=DOMAIN_SOURCES_JOINED.get(domain_key, "")
+    )
     text, err = _generate_with_model(prompt)
     if text:
-        parsed = _extract_json_from_text(text)
+        parsed = _parse_model_json(text)
         if isinstance(parsed, dict):
-            try:
-                parsed["confidence"] = float(parsed.get("confidence", 0) or 0)
-            except Exception:
-                parsed["confidence"] = 0.0
-            if "sources" not in parsed or not parsed.get("sources"):
-                parsed["sources"] = fallback_sources
-            parsed.setdefault("claim", claim)
-            parsed.setdefault("domain", domain_key)
-            parsed.setdefault("status", "Unverified")
-            parsed.setdefault("explanation", parsed.get("explanation", "No explanation provided"))
-            return parsed
+            return _finalize(parsed, claim, domain_key, fallback_sources)
 
     # Last fallback: no data
-    return {
-        "claim": claim,
-        "domain": domain_key,
-        "status": "Unverified",
-        "confidence": 0.30,
-        "explanation": "No fact-check / news results and model could not provide a parseable response.",
-        "sources": fallback_sources
-    }
+    return VerifyResult(
+        claim=claim,
+        domain=domain_key,
+        status="Unverified",
+        confidence=0.30,
+        explanation="No fact-check / news results and model could not provide a parseable response.",
+        sources=fallback_sources,
+    )
+
+# Streamlit-level memoization: reruns (theme toggles, widget churn) with the
+# same claim+domain short-circuit the whole pipeline via the content cache.
+@st.cache_data(ttl=3600, show_spinner=False)
+def _verify_cached(claim: str, domain: str):
+    return verify_claim(claim, domain)
 
 # ----------------------
 # 🌐 Streamlit UI - AI Misinformation Checker
@@ -269,8 +523,6 @@ If unsure, set status to "Unverified" and confidence between 0 and 1.
 # ⚠️ NOTE: Your entire UI, HTML, CSS remains untouched below
 # ----------------------
 
-import streamlit as st
-
 # ----------------------
 # PAGE CONFIGURATION
 # ----------------------
@@ -372,9 +624,9 @@ dark_mode = True if st.session_state.theme == "Dark" else False
 # ----------------------
 # DARK THEME CSS
 # ----------------------
-def load_dark_theme():
-    st.markdown(
-        """
+# Static CSS lives in module constants: no per-rerun function call or
+# string rebuild, one st.markdown emit below.
+DARK_CSS = """
         <style>
             body {
                 background-color: #0E1117;
@@ -423,16 +675,12 @@ def load_dark_theme():
                 color: #FAFAFA;
             }
         </style>
-        """,
-        unsafe_allow_html=True,
-    )
+        """
 
 # ----------------------
 # LIGHT THEME CSS (FIXED SELECTBOX)
 # ----------------------
-def load_light_theme():
-    st.markdown(
-        """
+LIGHT_CSS = """
         <style>
             body {
                 background-color: #F0F0F2;
@@ -514,24 +762,25 @@ def load_light_theme():
                 color: #000000;
             }
         </style>
-        """,
-        unsafe_allow_html=True,
-    )
+        """
 
 # Load CSS
-if dark_mode:
-    load_dark_theme()
-else:
-    load_light_theme()
+st.markdown(DARK_CSS if dark_mode else LIGHT_CSS, unsafe_allow_html=True)
 
 
 # ----------------------
 # LOGO + TITLE
 # ----------------------
-if dark_mode:
-    st.image("black_logo.png", width=80)
-else:
-    st.image("white_logo.png", width=80)
+@st.cache_data
+def _logo_b64(path: str) -> str:
+    """Read and base64-encode a logo once per process (no disk read per rerun)."""
+    return base64.b64encode(pathlib.Path(path).read_bytes()).decode()
+
+logo_path = "black_logo.png" if dark_mode else "white_logo.png"
+st.markdown(
+    f'<img src="data:image/png;base64,{_logo_b64(logo_path)}" width="80">',
+    unsafe_allow_html=True,
+)
 
 st.markdown("<h1 style='margin-top:0'>AI Misinformation Checker</h1>", unsafe_allow_html=True)
 st.write("Enter a claim and select a domain to verify if it's true, false, misleading, or unverified.")
@@ -552,15 +801,18 @@ domain = st.selectbox(
 if st.button("Verify"):
     if claim.strip():
         with st.spinner("Verifying claim..."):
-            result = verify_claim(claim, domain)
+            result = _verify_cached(claim, domain)
 
         st.subheader("Result")
-        st.markdown(f"**Status:** {result['status']}")
-        st.markdown(f"**Confidence:** {round(result['confidence']*100, 2)}%")
-        st.markdown(f"**Explanation:** {result['explanation']}")
-        if result.get("sources"):
-            st.markdown("### Sources")
-            for src in result["sources"]:
-                st.markdown(f"- [{src}]({src})")
+        # One markdown element = one component message to the browser
+        out = [
+            f"**Status:** {result.status}",
+            f"**Confidence:** {round(result.confidence*100, 2)}%",
+            f"**Explanation:** {result.explanation}",
+        ]
+        if result.sources:
+            out.append("### Sources")
+            out.extend(f"- [{src}]({src})" for src in result.sources)
+        st.markdown("\n\n".join(out))
     else:
         st.warning("Please enter a claim before verifying.")